@@ -5,208 +5,328 @@ Author: [Your Name]
 Date: [Current Date]
 
 This script reads beam force data from Excel and generates a professional
-engineering report with SFD and BMD diagrams using PyLaTeX and TikZ.
+engineering report with SFD and BMD diagrams using LaTeX and matplotlib.
 """
 
-import pandas as pd
+import glob
+import hashlib
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 import numpy as np
-from pylatex import Document, Section, Subsection, Figure, Tabular, Command, Package
-from pylatex.utils import NoEscape, italic
+from openpyxl import load_workbook
 import os
+from pathlib import Path
+import shutil
+import subprocess
+from string import Template
+
+# Beam picture embedded in the report; also part of the PDF cache key
+_BEAM_IMAGE = 'Beam.png'
+
+# Full report source; only the data-driven fields are substituted per run
+_REPORT_TEMPLATE = Template(r"""\documentclass[a4paper,12pt]{report}
+\usepackage[T1]{fontenc}
+\usepackage[utf8]{inputenc}
+\usepackage{lmodern}
+\usepackage{textcomp}
+\usepackage[margin=1in]{geometry}
+\usepackage{graphicx}
+
+\title{Beam Analysis Report}
+\author{Structural Engineering Analysis}
+\date{\today}
+
+\begin{document}
+\maketitle
+\tableofcontents
+\newpage
+
+\section{Introduction}
+\label{sec:Introduction}
+This engineering report presents a comprehensive analysis of a simply supported beam subjected to various loads. The analysis includes shear force and bending moment calculations with corresponding diagrams.
+
+\subsection{Beam Description}
+\label{subsec:BeamDescription}
+The structural element under analysis is a simply supported beam with pinned support at one end and roller support at the other. This configuration allows for rotation at both ends while preventing vertical displacement at supports.
+
+\begin{figure}[h!]
+\centering
+\includegraphics[width=0.8\textwidth]{$BEAM_IMAGE}
+\caption{Simply Supported Beam Configuration}
+\end{figure}
+
+\subsection{Data Source}
+\label{subsec:DataSource}
+The force and moment analysis data was obtained from the provided Excel spreadsheet. The calculated values at various points along the beam length are presented in the table below:
+
+\begin{tabular}{|c|c|c|}
+\hline
+Position (m) & Shear Force (kN) & Bending Moment (kNm) \\ \hline
+$TABLE_ROWS
+\end{tabular}
+
+\section{Analysis}
+\label{sec:Analysis}
+The beam analysis reveals the internal forces and moments along the beam length. Key observations from the calculations:
+
+\subsection{Shear Force Diagram (SFD)}
+\label{subsec:ShearForceDiagram(SFD)}
+The Shear Force Diagram illustrates the variation of internal shear force along the beam length. Positive values indicate upward shear, while negative values indicate downward shear.
+
+\begin{figure}[h!]
+\centering
+\includegraphics[width=\textwidth]{$SFD_IMAGE}
+\end{figure}
+
+\textbf{Key Observations:}
+\begin{itemize}
+\item Maximum shear force: $MAX_SF kN
+$ZERO_SHEAR_ITEMS
+\end{itemize}
+
+\subsection{Bending Moment Diagram (BMD)}
+\label{subsec:BendingMomentDiagram(BMD)}
+The Bending Moment Diagram shows the variation of internal bending moment. Positive bending moment causes tension in the bottom fibers of the beam.
+
+\begin{figure}[h!]
+\centering
+\includegraphics[width=\textwidth]{$BMD_IMAGE}
+\end{figure}
+
+\textbf{Key Observations:}
+\begin{itemize}
+\item Maximum bending moment: $MAX_BM kNm at $X_MAX_BM m
+\item Zero moments occur at both supports
+\item Parabolic distribution indicates uniformly distributed load
+\end{itemize}
+
+\section{Summary}
+\label{sec:Summary}
+This analysis successfully demonstrates the fundamental principles of beam mechanics for a simply supported configuration.
+
+\subsection{Shear Force Diagram}
+\label{subsec:ShearForceDiagram}
+A Shear Force Diagram (SFD) is a graphical representation that shows the internal shear force at every point along a beam. It helps structural engineers identify critical sections where shear stresses are maximum and where shear reinforcement may be required.
+
+\subsection{Bending Moment Diagram}
+\label{subsec:BendingMomentDiagram}
+A Bending Moment Diagram (BMD) illustrates the internal bending moment along the beam length. It indicates locations of maximum bending stress, helping engineers determine appropriate beam dimensions and reinforcement for moment resistance.
+
+Both diagrams are essential tools in structural design, ensuring that beams are properly sized and reinforced to withstand applied loads safely.
+
+\end{document}
+""")
 
 def generate_beam_report():
     """Generate complete beam analysis report with SFD and BMD"""
     
-    print("📊 Reading beam data from Excel...")
+    # Reuse a previously built PDF when none of its inputs changed
+    data_digest = file_digest('beam_data.xlsx')
+    cached_pdf = os.path.join('cache', f"{report_cache_key(data_digest, _BEAM_IMAGE)}.pdf")
+    if os.path.exists(cached_pdf):
+        shutil.copy(cached_pdf, 'beam_analysis_report.pdf')
+        print("✅ Inputs unchanged, reused cached report: beam_analysis_report.pdf")
+        return
     
     # Read the Excel data
-    df = pd.read_excel('beam_data.xlsx')
-    
-    # Create document with additional packages
-    doc = Document(documentclass='report', document_options=['a4paper', '12pt'])
-    
-    # Add required packages for TikZ and plots
-    doc.packages.append(Package('tikz'))
-    doc.packages.append(Package('pgfplots'))
-    doc.packages.append(Package('geometry', options=['margin=1in']))
-    doc.packages.append(Package('graphicx'))
-    
-    # Title page
-    doc.preamble.append(Command('title', 'Beam Analysis Report'))
-    doc.preamble.append(Command('author', 'Structural Engineering Analysis'))
-    doc.preamble.append(Command('date', NoEscape(r'\today')))
-    doc.append(NoEscape(r'\maketitle'))
-    
-    # Table of contents
-    doc.append(NoEscape(r'\tableofcontents'))
-    doc.append(NoEscape(r'\newpage'))
-    
-    # Introduction section
-    with doc.create(Section('Introduction')):
-        doc.append('This engineering report presents a comprehensive analysis of a simply supported beam subjected to various loads. The analysis includes shear force and bending moment calculations with corresponding diagrams.')
-        
-        # Beam description subsection
-        with doc.create(Subsection('Beam Description')):
-            doc.append('The structural element under analysis is a simply supported beam with pinned support at one end and roller support at the other. This configuration allows for rotation at both ends while preventing vertical displacement at supports.')
-            
-            # Embed beam image
-            with doc.create(Figure(position='h!')) as beam_fig:
-                beam_fig.add_image('beam.png', width=NoEscape(r'0.8\textwidth'))
-                beam_fig.add_caption('Simply Supported Beam Configuration')
-        
-        # Data source subsection
-        with doc.create(Subsection('Data Source')):
-            doc.append('The force and moment analysis data was obtained from the provided Excel spreadsheet. The calculated values at various points along the beam length are presented in the table below:')
-            
-            # Recreate force table using LaTeX tabular
-            with doc.create(Tabular('|c|c|c|')) as table:
-                table.add_hline()
-                table.add_row(('Position (m)', 'Shear Force (kN)', 'Bending Moment (kNm)'))
-                table.add_hline()
-                
-                for _, row in df.iterrows():
-                    table.add_row((f"{row['X']:.1f}", f"{row['Shear force']:.1f}", f"{row['Bending Moment']:.1f}"))
-                    table.add_hline()
-    
-    # Analysis section
-    with doc.create(Section('Analysis')):
-        doc.append('The beam analysis reveals the internal forces and moments along the beam length. Key observations from the calculations:')
-        
-        # SFD subsection
-        with doc.create(Subsection('Shear Force Diagram (SFD)')):
-            doc.append('The Shear Force Diagram illustrates the variation of internal shear force along the beam length. Positive values indicate upward shear, while negative values indicate downward shear.')
-            
-            # Generate TikZ SFD plot
-            sfd_tikz = generate_sfd_plot(df)
-            doc.append(NoEscape(sfd_tikz))
-            
-            doc.append('\\textbf{Key Observations:}')
-            doc.append(NoEscape(r'\begin{itemize}'))
-            doc.append(NoEscape(r'\item Maximum shear force: 45 kN'))
-            doc.append(NoEscape(r'\item Zero shear occurs at 7.5 m from left support'))
-            doc.append(NoEscape(r'\item Shear force changes sign at the point of maximum moment'))
-            doc.append(NoEscape(r'\end{itemize}'))
-        
-        # BMD subsection  
-        with doc.create(Subsection('Bending Moment Diagram (BMD)')):
-            doc.append('The Bending Moment Diagram shows the variation of internal bending moment. Positive bending moment causes tension in the bottom fibers of the beam.')
-            
-            # Generate TikZ BMD plot
-            bmd_tikz = generate_bmd_plot(df)
-            doc.append(NoEscape(bmd_tikz))
-            
-            doc.append('\\textbf{Key Observations:}')
-            doc.append(NoEscape(r'\begin{itemize}'))
-            doc.append(NoEscape(r'\item Maximum bending moment: 168.75 kNm at 7.5 m'))
-            doc.append(NoEscape(r'\item Zero moments occur at both supports'))
-            doc.append(NoEscape(r'\item Parabolic distribution indicates uniformly distributed load'))
-            doc.append(NoEscape(r'\end{itemize}'))
-    
-    # Summary section
-    with doc.create(Section('Summary')):
-        doc.append('This analysis successfully demonstrates the fundamental principles of beam mechanics for a simply supported configuration.')
-        
-        with doc.create(Subsection('Shear Force Diagram')):
-            doc.append('A Shear Force Diagram (SFD) is a graphical representation that shows the internal shear force at every point along a beam. It helps structural engineers identify critical sections where shear stresses are maximum and where shear reinforcement may be required.')
-            
-        with doc.create(Subsection('Bending Moment Diagram')):
-            doc.append('A Bending Moment Diagram (BMD) illustrates the internal bending moment along the beam length. It indicates locations of maximum bending stress, helping engineers determine appropriate beam dimensions and reinforcement for moment resistance.')
-            
-        doc.append('Both diagrams are essential tools in structural design, ensuring that beams are properly sized and reinforced to withstand applied loads safely.')
+    x, sf, bm = load_beam_data('beam_data.xlsx', data_digest)
+    max_sf, x_zero_sf, max_bm, x_max_bm = summarize_beam(x, sf, bm)
+    os.makedirs('build', exist_ok=True)
+    
+    # Render both diagrams
+    sfd_image = generate_sfd_plot(x, sf)
+    bmd_image = generate_bmd_plot(x, bm)
+    
+    # Recreate force table rows from the formatted columns
+    xs, sfs, bms = (np.char.mod('%.1f', col) for col in (x, sf, bm))
+    table_rows = '\n'.join(rf'{xi} & {si} & {mi} \\ \hline'
+                           for xi, si, mi in zip(xs, sfs, bms))
+    
+    # Fill in the data-driven parts of the report; image paths use '/' so a
+    # Windows separator is not read as a LaTeX control sequence
+    tex_source = _REPORT_TEMPLATE.substitute(
+        BEAM_IMAGE=_BEAM_IMAGE,
+        TABLE_ROWS=table_rows,
+        SFD_IMAGE=Path(sfd_image).as_posix(),
+        BMD_IMAGE=Path(bmd_image).as_posix(),
+        MAX_SF=f'{max_sf:g}',
+        ZERO_SHEAR_ITEMS=zero_shear_items(x_zero_sf),
+        MAX_BM=f'{max_bm:g}',
+        X_MAX_BM=f'{x_max_bm:g}',
+    )
     
     # Generate PDF
     print("📄 Generating PDF report...")
-    doc.generate_pdf('beam_analysis_report', clean_tex=False)
+    compile_pdf('beam_analysis_report', tex_source)
+    
+    # Keep only the entry for the current inputs so the cache does not grow
+    os.makedirs('cache', exist_ok=True)
+    for entry in os.listdir('cache'):
+        os.remove(os.path.join('cache', entry))
+    shutil.copy('beam_analysis_report.pdf', cached_pdf)
     print("✅ PDF report generated successfully: beam_analysis_report.pdf")
 
-def generate_sfd_plot(df):
-    """Generate TikZ code for Shear Force Diagram"""
-    
-    tikz_code = r"""
-    \begin{center}
-    \begin{tikzpicture}
-    \begin{axis}[
-        width=14cm,
-        height=6cm,
-        xlabel={Beam Length (m)},
-        ylabel={Shear Force (kN)},
-        grid=major,
-        grid style={dotted,gray!50},
-        xmin=0, xmax=12,
-        ymin=-50, ymax=50,
-        xtick={0,2,4,6,8,10,12},
-        ytick={-40,-20,0,20,40},
-        legend pos=north east,
-        title={Shear Force Diagram},
-        axis lines=left,
-        thick
-    ]
-    \addplot[
-        color=blue,
-        mark=*,
-        mark size=1.5pt,
-        line width=1.5pt
-    ]
-    coordinates {
-    """
+def zero_shear_items(x_zero_sf):
+    """Format the SFD observation bullets about the zero-shear point"""
     
-    # Add coordinates from dataframe
-    for _, row in df.iterrows():
-        tikz_code += f"        ({row['X']}, {row['Shear force']})\n"
+    if x_zero_sf is None:
+        return r'\item Shear force does not change sign along the beam'
+    return '\n'.join([rf'\item Zero shear occurs at {x_zero_sf:g} m from left support',
+                      r'\item Shear force changes sign at the point of maximum moment'])
+
+def summarize_beam(x, sf, bm):
+    """Compute the key SFD/BMD values quoted in the report
     
-    tikz_code += r"""    };
-    \addplot[color=red, dashed, line width=1pt] coordinates {(0,0) (12,0)};
-    \legend{Shear Force, Zero Line}
-    \end{axis}
-    \end{tikzpicture}
-    \end{center}
+    The zero-shear position is None when the shear force never changes sign.
     """
     
-    return tikz_code
-
-def generate_bmd_plot(df):
-    """Generate TikZ code for Bending Moment Diagram"""
-    
-    tikz_code = r"""
-    \begin{center}
-    \begin{tikzpicture}
-    \begin{axis}[
-        width=14cm,
-        height=6cm,
-        xlabel={Beam Length (m)},
-        ylabel={Bending Moment (kNm)},
-        grid=major,
-        grid style={dotted,gray!50},
-        xmin=0, xmax=12,
-        ymin=0, ymax=180,
-        xtick={0,2,4,6,8,10,12},
-        ytick={0,40,80,120,160},
-        legend pos=north east,
-        title={Bending Moment Diagram},
-        axis lines=left,
-        thick
-    ]
-    \addplot[
-        color=red,
-        mark=*,
-        mark size=1.5pt,
-        line width=1.5pt
-    ]
-    coordinates {
-    """
+    max_sf = sf[np.argmax(np.abs(sf))]
+    
+    # Zero shear: interpolate within the first interval where the sign changes
+    crossings = np.flatnonzero(sf[:-1] * sf[1:] <= 0)
+    if crossings.size:
+        i = crossings[0]
+        order = np.argsort(sf[i:i + 2])
+        x_zero_sf = np.interp(0.0, sf[i:i + 2][order], x[i:i + 2][order])
+    else:
+        x_zero_sf = None
     
-    # Add coordinates from dataframe
-    for _, row in df.iterrows():
-        tikz_code += f"        ({row['X']}, {row['Bending Moment']})\n"
+    i_max_bm = np.argmax(bm)
+    return max_sf, x_zero_sf, bm[i_max_bm], x[i_max_bm]
+
+def file_digest(path):
+    """Return a short BLAKE2b hex digest of the file at path"""
+    
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+def report_cache_key(data_digest, image_path):
+    """Hash the report inputs to key the PDF cache
     
-    tikz_code += r"""    };
-    \legend{Bending Moment}
-    \end{axis}
-    \end{tikzpicture}
-    \end{center}
+    Covers the Excel data (via its digest), the embedded beam image, this
+    script and the matplotlib version used for the diagrams. A cache hit
+    reuses the PDF as built, including the \\today date it was typeset with.
     """
     
-    return tikz_code
+    h = hashlib.blake2b(data_digest.encode(), digest_size=8)
+    for path in (image_path, __file__):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    h.update(matplotlib.__version__.encode())
+    return h.hexdigest()
+
+def compile_pdf(name, tex_source, build_dir='build'):
+    """Compile tex_source with pdflatex as job NAME, keeping auxiliary files in build_dir"""
+    
+    tex_path = os.path.join(build_dir, f'{name}.tex')
+    toc_path = os.path.join(build_dir, f'{name}.toc')
+    previous_toc = read_if_exists(toc_path)
+    
+    # On POSIX feed the source through stdin so no intermediate .tex is written;
+    # elsewhere /dev/stdin does not exist, so fall back to a file in build_dir
+    if os.name == 'posix':
+        source, stdin = r'\input /dev/stdin', tex_source
+    else:
+        write_text(tex_path, tex_source)
+        source, stdin = Path(tex_path).as_posix(), None
+    command = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error',
+               f'-jobname={name}', f'-output-directory={build_dir}', source]
+    
+    try:
+        subprocess.run(command, input=stdin, text=True, check=True)
+        
+        # A second pass is only needed when the table of contents changed
+        if read_if_exists(toc_path) != previous_toc:
+            subprocess.run(command, input=stdin, text=True, check=True)
+    except subprocess.CalledProcessError:
+        # Keep the source next to the log so a failed build can be debugged
+        write_text(tex_path, tex_source)
+        raise
+    shutil.copy(os.path.join(build_dir, f'{name}.pdf'), f'{name}.pdf')
+
+def write_text(path, text):
+    """Write text to path as UTF-8"""
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def read_if_exists(path):
+    """Return the bytes of path, or None when it does not exist yet"""
+    
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+def load_beam_data(path, digest, cache_dir='build'):
+    """Load beam columns, using a binary copy of the sheet when one matches its digest"""
+    
+    # Key the .npy copy on the sheet's contents so a replaced file is never served stale
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f'{stem}-{digest}.npy')
+    if os.path.exists(cache_path):
+        print("📊 Loading cached beam data...")
+        x, sf, bm = np.load(cache_path).astype(np.float64, copy=False)
+        return x, sf, bm
+    
+    # Parse the XLSX once and keep a .npy copy for subsequent runs
+    print("📊 Reading beam data from Excel...")
+    x, sf, bm = read_beam_data(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale_path in glob.glob(os.path.join(cache_dir, f'{stem}-*.npy')):
+        os.remove(stale_path)
+    np.save(cache_path, np.stack([x, sf, bm]))
+    return x, sf, bm
+
+def read_beam_data(path):
+    """Read position, shear force and bending moment columns from Excel"""
+    
+    # Stream the sheet in read-only mode instead of building a DataFrame
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        header = next(ws.iter_rows(max_row=1, values_only=True))
+        header = [str(name).strip().lower() for name in header]
+        cols = [header.index(name) for name in ('x', 'shear force', 'bending moment')]
+        
+        # Only materialise cells within the needed columns
+        first, last = min(cols), max(cols)
+        rows = ws.iter_rows(min_row=2, min_col=first + 1, max_col=last + 1, values_only=True)
+        data = [tuple(row[c - first] for c in cols) for row in rows if row[cols[0] - first] is not None]
+    finally:
+        wb.close()
+    
+    # Column arrays, so each consumer zips plain floats instead of indexing rows
+    x, sf, bm = (np.array(col, dtype=np.float64) for col in zip(*data))
+    return x, sf, bm
+
+def plot_diagram(x, y, path, label, ylabel, color, zero_line=False):
+    """Render a force/moment diagram to a vector PDF with matplotlib"""
+    
+    fig, ax = plt.subplots(figsize=(14 / 2.54, 6 / 2.54))
+    ax.plot(x, y, color=color, marker='o', markersize=3, linewidth=1.5, label=label)
+    if zero_line:
+        ax.axhline(0, color='red', linestyle='--', linewidth=1, label='Zero Line')
+    ax.set_title(f'{label} Diagram')
+    ax.set_xlabel('Beam Length (m)')
+    ax.set_ylabel(ylabel)
+    ax.grid(True, linestyle=':', color='gray', alpha=0.5)
+    ax.spines[['top', 'right']].set_visible(False)
+    ax.legend(loc='best')
+    fig.savefig(path, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+def generate_sfd_plot(x, sf, path=os.path.join('build', 'sfd.pdf')):
+    """Generate the Shear Force Diagram image"""
+    
+    return plot_diagram(x, sf, path, 'Shear Force', 'Shear Force (kN)', 'blue', zero_line=True)
+
+def generate_bmd_plot(x, bm, path=os.path.join('build', 'bmd.pdf')):
+    """Generate the Bending Moment Diagram image"""
+    
+    return plot_diagram(x, bm, path, 'Bending Moment', 'Bending Moment (kNm)', 'red')
 
 if __name__ == "__main__":
     generate_beam_report()
\ No newline at end of file